@@ -25,8 +25,13 @@ import json
 import os
 import pathlib
 import subprocess
+import typing
+
+if typing.TYPE_CHECKING:
+    from typing import Iterator
 
 _GLOBAL_FILES = ('.github', 'justfile', 'pyproject.toml')
+_CHUNK_SIZE = 1 << 16
 
 
 def _parse_args() -> str:
@@ -49,10 +54,27 @@ def _get_changed_packages(git_base_ref: str) -> list[str]:
     if not git_base_ref:
         print('Using all packages because no git base ref was provided:')
         return all_packages
-    cmd = ['git', 'diff', '--name-only', f'origin/{git_base_ref}']
-    output = subprocess.check_output(cmd, text=True)
-    diff = [p.split('/') for p in output.split('\n')]
-    changes = {*(p[0] for p in diff), *('/'.join(p[:2]) for p in diff)}
+    if _count_commits(f'origin/{git_base_ref}...HEAD') == 0:
+        # HEAD is the base commit, so there is nothing to diff
+        print(f'Using no packages because HEAD is the same commit as {git_base_ref}:')
+        return []
+    # limit the diff to paths we care about, and separate paths with NUL so they're never quoted
+    # a rename is just a deletion and an addition here, so skip rename detection
+    pathspecs = [*all_packages, *_GLOBAL_FILES]
+    cmd = [
+        'git',
+        'diff',
+        '-z',
+        '--name-only',
+        '--no-renames',
+        f'origin/{git_base_ref}',
+        '--',
+        *pathspecs,
+    ]
+    changes: set[str] = set()
+    for path in _iter_output(cmd, sep=b'\0'):
+        parts = path.decode().split('/', maxsplit=2)
+        changes.update((parts[0], '/'.join(parts[:2])))
     if global_changes := sorted(changes.intersection(_GLOBAL_FILES)):
         print(f'Using all packages because global files were changed: {global_changes}')
         return all_packages
@@ -60,10 +82,39 @@ def _get_changed_packages(git_base_ref: str) -> list[str]:
     return sorted(changes.intersection(all_packages))
 
 
-def _get_packages(root: pathlib.Path | str, exclude: str | None = None) -> list[str]:
-    root = pathlib.Path(root)
-    paths = [root / '.package', *root.glob(r'[a-z]*')]
-    return sorted(str(path) for path in paths if path.is_dir() and path.name != exclude)
+def _count_commits(revision_range: str) -> int:
+    cmd = ['git', 'rev-list', '--count', revision_range]
+    return int(subprocess.check_output(cmd, text=True))
+
+
+def _iter_output(cmd: list[str], sep: bytes) -> Iterator[bytes]:
+    """Yield each non-empty ``sep`` separated item of the output of ``cmd`` as it's produced.
+
+    Unlike :func:`subprocess.check_output`, the full output is never held in memory.
+    """
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE) as process:
+        assert process.stdout is not None
+        remainder = b''
+        while chunk := process.stdout.read(_CHUNK_SIZE):
+            *items, remainder = (remainder + chunk).split(sep)
+            yield from filter(None, items)
+        if remainder:
+            yield remainder
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, cmd)
+
+
+def _get_packages(root: str, exclude: str | None = None) -> list[str]:
+    # DirEntry.is_dir uses the file type from the directory listing, avoiding a stat per entry
+    with os.scandir(root) as entries:
+        names = [
+            entry.name
+            for entry in entries
+            if (entry.name == '.package' or 'a' <= entry.name[:1] <= 'z')
+            and entry.name != exclude
+            and entry.is_dir()
+        ]
+    return sorted(os.path.normpath(os.path.join(root, name)) for name in names)
 
 
 if __name__ == '__main__':
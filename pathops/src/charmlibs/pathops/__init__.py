@@ -18,12 +18,14 @@ The ``pathops`` charm library provides:
 
 - :class:`PathProtocol`: defines the interface of methods common to both local and container paths.
   Use this to type annotate code designed to work on both Kubernetes and machine charms.
+- :class:`PurePathProtocol`: the subset of :class:`PathProtocol` that doesn't access the
+  filesystem, for annotating code that only manipulates paths.
 - :class:`ContainerPath`: the concrete implementation of the interface for remote paths in the
   workload container of Kubernetes charms. Operations are implemented using the Pebble file API.
 - :class:`LocalPath`: the concrete implementation of the interface for local paths, which includes
   both machine charms and the charm container of Kubernetes charms.
 - Top-level helper functions such as :func:`ensure_contents`, which operate on both container
-  and local paths.
+  and local paths, and :func:`batch`, which caches container file metadata across calls.
 
 :class:`ContainerPath` methods that interact with the remote filesystem will raise a
 :class:`PebbleConnectionError` if the workload container isn't reachable.
@@ -38,17 +40,20 @@ from pathlib import Path as _Path  # for __version__
 from ops.pebble import ConnectionError as PebbleConnectionError
 
 from ._container_path import ContainerPath, RelativePathError
-from ._functions import ensure_contents
+from ._functions import batch, ensure_contents, is_pathprotocol
 from ._local_path import LocalPath
-from ._types import PathProtocol
+from ._types import PathProtocol, PurePathProtocol
 
 __all__ = (
     'ContainerPath',
     'LocalPath',
     'PathProtocol',
     'PebbleConnectionError',
+    'PurePathProtocol',
     'RelativePathError',
+    'batch',
     'ensure_contents',
+    'is_pathprotocol',
 )
 
 __version__ = (_Path(__file__).parent / '_version.txt').read_text().strip()
@@ -24,14 +24,17 @@ import typing
 import ops
 from ops import pebble
 
-from . import _constants, _errors, _fileinfo
+from . import _constants, _errors, _fileinfo, _local_path
 
 if typing.TYPE_CHECKING:
+    import io
     import os
-    from typing import Generator, Literal
+    from typing import BinaryIO, Generator, Iterator, Literal, Sequence, TextIO
 
     from typing_extensions import Self, TypeGuard
 
+    from ._types import PathProtocol
+
 
 class RelativePathError(ValueError):
     """ContainerPath only supports absolute paths.
@@ -71,6 +74,8 @@ class ContainerPath:
         RelativePathError: If instantiated with a relative path.
     """
 
+    _is_pathprotocol = True  # see is_pathprotocol
+
     def __init__(self, *parts: str | os.PathLike[str], container: ops.Container) -> None:
         self._container = container
         self._path = pathlib.PurePosixPath(*parts)
@@ -157,6 +162,22 @@ class ContainerPath:
         matched. The recursive wildcard ``'**'`` is **not** supported by this method. Matching is
         always case-sensitive. Only the path is matched against, the container is not considered.
         """
+        name = self._path.name
+        if (
+            type(path_pattern) is str
+            and name
+            and path_pattern not in ('', '.')  # normalised to an empty pattern, a ValueError
+            and '/' not in path_pattern
+        ):
+            # a single component pattern is matched against the name only, so simple patterns
+            # can be checked with string methods, rather than compiling a regular expression
+            head, star, tail = path_pattern.partition('*')
+            if not _has_wildcard(head) and not _has_wildcard(tail):
+                if not star:
+                    return name == path_pattern
+                return len(name) >= len(head) + len(tail) and (
+                    name.startswith(head) and name.endswith(tail)
+                )
         return self._path.match(path_pattern)
 
     def with_name(self, name: str) -> Self:
@@ -209,6 +230,19 @@ class ContainerPath:
         """
         return self.with_segments(self._path, *other)
 
+    def with_segments(self, *pathsegments: str | os.PathLike[str]) -> Self:
+        """Construct a new ``ContainerPath`` (with the same container) from path-like objects.
+
+        You can think of this like a copy of the current :class:`ContainerPath`, with its path
+        replaced by ``pathlib.Path(*pathsegments)``.
+
+        This method is used internally by all :class:`ContainerPath` methods that return new
+        :class:`ContainerPath` instances, including :meth:`parent` and :meth:`parents`. Therefore,
+        subclasses can customise the behaviour of all such methods by overriding only this method.
+        The same is true of :class:`pathlib.Path` in Python 3.12+.
+        """
+        return type(self)(*pathsegments, container=self._container)
+
     @property
     def parents(self) -> tuple[Self, ...]:
         """A sequence of this path's logical parents. Each parent is a :class:`ContainerPath`."""
@@ -297,23 +331,72 @@ class ContainerPath:
         """
         return self._pull(text=False)
 
+    def read_bytes_into(self, buffer: bytearray | memoryview) -> int:
+        """Read a remote file into the provided buffer, returning the number of bytes read.
+
+        Up to ``len(buffer)`` bytes are copied straight from the pulled file, without
+        building an intermediate :class:`bytes` object as :meth:`read_bytes` does.
+
+        Returns:
+            The number of bytes read into ``buffer``.
+
+        Raises:
+            FileNotFoundError: if the parent directory does not exist.
+            IsADirectoryError: if the target is a directory.
+            PermissionError: if the Pebble user does not have permissions for the operation.
+            PebbleConnectionError: if the remote Pebble client cannot be reached.
+        """
+        with self._open(encoding=None) as f:
+            # the pulled file is buffered, so readinto fills the buffer unless it reaches EOF
+            return typing.cast('io.BufferedIOBase', f).readinto(buffer)
+
+    def copy_to(self, target: PathProtocol) -> int:
+        """Copy the contents of this remote file to ``target``, which may be any path type.
+
+        This has the same effect as ``target.write_bytes(self.read_bytes())``, but the file
+        pulled from Pebble is copied to a :class:`LocalPath` by the kernel, or streamed back
+        to Pebble for another ``ContainerPath``, without being read into memory.
+
+        Returns:
+            The number of bytes copied.
+
+        Raises:
+            FileNotFoundError: if this path or the target's parent directory does not exist.
+            IsADirectoryError: if this path is a directory.
+            PermissionError: if the local or Pebble user does not have permissions for the
+                operation.
+            PebbleConnectionError: if the remote Pebble client cannot be reached.
+        """
+        with self._open(encoding=None) as f:
+            return _local_path.copy_file_to(f, target)
+
     @typing.overload
     def _pull(self, *, text: Literal[True]) -> str: ...
     @typing.overload
     def _pull(self, *, text: Literal[False] = False) -> bytes: ...
     def _pull(self, *, text: bool = False):
         encoding = 'utf-8' if text else None
+        with self._open(encoding=encoding) as f:
+            return f.read()
+
+    @typing.overload
+    def _open(self, *, encoding: str) -> TextIO: ...
+    @typing.overload
+    def _open(self, *, encoding: None) -> BinaryIO: ...
+    def _open(self, *, encoding: str | None):
         try:
-            with self._container.pull(self._path, encoding=encoding) as f:
-                return f.read()
+            return self._container.pull(self._path, encoding=encoding)
         except pebble.PathError as e:
-            msg = repr(self)
-            _errors.raise_if_matches_file_not_found(e, msg=msg)
-            _errors.raise_if_matches_is_a_directory(e, msg=msg)
-            _errors.raise_if_matches_permission(e, msg=msg)
+            _errors.raise_if_matches(
+                e,
+                repr(self),
+                _errors.raise_file_not_found,
+                _errors.raise_is_a_directory,
+                _errors.raise_permission,
+            )
             raise
 
-    def iterdir(self) -> typing.Generator[Self]:
+    def iterdir(self) -> Iterator[Self]:
         """Yield :class:`ContainerPath` objects corresponding to the directory's contents.
 
         There are no guarantees about the order of the children. The special entries
@@ -332,11 +415,10 @@ class ContainerPath:
         info = _fileinfo.from_container_path(self)  # FileNotFoundError if path doesn't exist
         if info.type != pebble.FileType.DIRECTORY:
             _errors.raise_not_a_directory(repr(self))
-        file_infos = self._container.list_files(self._path)
-        for f in file_infos:
-            yield self.with_segments(f.path)
+        file_infos = self._container.list_files(self._path)  # the whole listing in one request
+        return (self.with_segments(f.path) for f in file_infos)
 
-    def glob(self, pattern: str | os.PathLike[str]) -> Generator[Self]:
+    def glob(self, pattern: str | os.PathLike[str]) -> Iterator[Self]:
         r"""Iterate over this directory and yield all paths matching the provided pattern.
 
         For example, ``path.glob('*.txt')``, ``path.glob('*/foo.txt')``.
@@ -368,7 +450,7 @@ class ContainerPath:
             raise NotImplementedError('Non-relative paths are unsupported.')
         elif pattern_path == pathlib.PurePosixPath('.'):
             raise ValueError(f'Unacceptable pettern: {pattern!r}')
-        *pattern_parents, pattern_itself = pattern_path.parts
+        pattern_parents = pattern_path.parts[:-1]
         if '**' in pattern_parents:
             raise NotImplementedError('Recursive glob is not supported.')
         if '**' in str(pattern):
@@ -376,23 +458,35 @@ class ContainerPath:
         if not skip_is_dir and not self.is_dir():
             yield from ()
             return
-        if not pattern_parents:
-            file_infos = self._container.list_files(self._path, pattern=pattern_itself)
-            for f in file_infos:
-                yield self.with_segments(f.path)
+        for path in self._glob_paths(self._path, pattern_path.parts):
+            yield self.with_segments(path)
+
+    def _glob_paths(self, directory: pathlib.PurePath, parts: Sequence[str]) -> Generator[str]:
+        """Yield the paths in directory matching the pattern parts, as strings.
+
+        Intermediate directories are handled as strings, using the file types returned by
+        Pebble, so only the matches themselves are constructed as :class:`ContainerPath` objects.
+        """
+        first, *rest = parts
+        if not rest:
+            for f in self._container.list_files(directory, pattern=first):
+                yield f.path
             return
-        first, *rest = pattern_parents
-        next_pattern = pathlib.PurePosixPath(*rest, pattern_itself)
-        if first == '*':
-            for container_path in self.iterdir():
-                if container_path.is_dir():
-                    yield from container_path._glob(next_pattern, skip_is_dir=True)
-        elif '*' in first:
-            for container_path in self._glob(first):
-                if container_path.is_dir():
-                    yield from container_path._glob(next_pattern, skip_is_dir=True)
-        else:
-            yield from (self / first)._glob(next_pattern)
+        if '*' in first:
+            if first == '*':
+                file_infos = self._container.list_files(directory)
+            else:
+                file_infos = self._container.list_files(directory, pattern=first)
+            for f in file_infos:
+                if self._is_dir_info(f):
+                    yield from self._glob_paths(pathlib.PurePosixPath(f.path), rest)
+        elif self.with_segments(directory, first).is_dir():
+            yield from self._glob_paths(directory / first, rest)
+
+    def _is_dir_info(self, info: pebble.FileInfo) -> bool:
+        if info.type == pebble.FileType.SYMLINK:  # Pebble doesn't say what the link points to
+            return self.with_segments(info.path).is_dir()
+        return info.type == pebble.FileType.DIRECTORY
 
     def owner(self) -> str:
         """Return the user name of the file owner.
@@ -532,11 +626,16 @@ class ContainerPath:
         try:
             self._container.remove_path(self._path)
         except pebble.PathError as e:
-            msg = repr(self)
-            _errors.raise_if_matches_directory_not_empty(e, msg=msg)
-            _errors.raise_if_matches_file_not_found(e, msg=msg)
-            _errors.raise_if_matches_permission(e, msg=msg)
+            _errors.raise_if_matches(
+                e,
+                repr(self),
+                _errors.raise_directory_not_empty,
+                _errors.raise_file_not_found,
+                _errors.raise_permission,
+            )
             raise
+        finally:
+            _fileinfo.invalidate(self)
 
     ##################################################
     # protocol Path methods with extended signatures #
@@ -582,6 +681,40 @@ class ContainerPath:
         if isinstance(data, (bytearray, memoryview)):
             # TODO: update ops to correctly test for bytearray and memoryview in push
             data = bytes(data)
+        self._push(data, mode=mode, user=user, group=group)
+        return len(data)
+
+    def _write_from_file(
+        self,
+        fd: int,
+        offset: int,
+        size_hint: int,
+        *,
+        mode: int | None = None,
+        user: str | None = None,
+        group: str | None = None,
+    ) -> int:
+        """Like :meth:`write_bytes`, but push the contents of ``fd`` from ``offset`` to its end.
+
+        The file is streamed to Pebble, rather than being read into memory first. The
+        ``size_hint`` is unused, as Pebble reads the file until EOF.
+
+        Returns:
+            The number of bytes pushed.
+        """
+        with open(fd, 'rb', closefd=False) as f:
+            f.seek(offset)
+            self._push(f, mode=mode, user=user, group=group)
+            return f.tell() - offset  # push reads the file to the end
+
+    def _push(
+        self,
+        source: bytes | BinaryIO,
+        *,
+        mode: int | None,
+        user: str | None,
+        group: str | None,
+    ) -> None:
         if mode is None or user is None:
             # if the file already exists, don't change owner or mode unless explicitly requested
             try:
@@ -596,7 +729,7 @@ class ContainerPath:
         try:
             self._container.push(
                 path=self._path,
-                source=data,
+                source=source,
                 make_dirs=False,
                 permissions=mode,
                 user=user,
@@ -604,12 +737,16 @@ class ContainerPath:
             )
         except pebble.PathError as e:
             _errors.raise_if_matches_lookup(e, msg=e.message)
-            msg = repr(self)
-            _errors.raise_if_matches_file_not_found(e, msg=msg)
-            _errors.raise_if_matches_not_a_directory(e, msg=msg)
-            _errors.raise_if_matches_permission(e, msg=msg)
+            _errors.raise_if_matches(
+                e,
+                repr(self),
+                _errors.raise_file_not_found,
+                _errors.raise_not_a_directory,
+                _errors.raise_permission,
+            )
             raise
-        return len(data)
+        finally:
+            _fileinfo.invalidate(self)
 
     def write_text(
         self,
@@ -735,24 +872,17 @@ class ContainerPath:
                 if not self.parent.is_dir():
                     _errors.raise_not_a_directory(msg=msg, from_=e)
                 _errors.raise_file_exists(repr(self), from_=e)
-            _errors.raise_if_matches_file_exists(e, msg=msg)
-            _errors.raise_if_matches_file_not_found(e, msg=msg)
-            _errors.raise_if_matches_permission(e, msg=msg)
+            _errors.raise_if_matches(
+                e,
+                msg,
+                _errors.raise_file_exists,
+                _errors.raise_file_not_found,
+                _errors.raise_permission,
+            )
             raise
+        finally:
+            _fileinfo.invalidate(self)
 
-    #############################
-    # non-protocol Path methods #
-    #############################
-
-    def with_segments(self, *pathsegments: str | os.PathLike[str]) -> Self:
-        """Construct a new ``ContainerPath`` (with the same container) from path-like objects.
-
-        You can think of this like a copy of the current :class:`ContainerPath`, with its path
-        replaced by ``pathlib.Path(*pathsegments)``.
 
-        This method is used internally by all :class:`ContainerPath` methods that return new
-        :class:`ContainerPath` instances, including :meth:`parent` and :meth:`parents`. Therefore,
-        subclasses can customise the behaviour of all such methods by overriding only this method.
-        The same is true of :class:`pathlib.Path` in Python 3.12+.
-        """
-        return type(self)(*pathsegments, container=self._container)
+def _has_wildcard(pattern: str) -> bool:
+    return '*' in pattern or '?' in pattern or '[' in pattern
@@ -18,34 +18,39 @@ from __future__ import annotations
 
 import errno
 import os
+import typing
 from typing import NoReturn
 
 from ops import pebble
 
+if typing.TYPE_CHECKING:
+    from typing import Callable, Optional, Sequence
+
+    _Raiser = Callable[[str, Optional[BaseException]], NoReturn]
+
+_STRERROR = {
+    e: os.strerror(e)
+    for e in (
+        errno.EEXIST,
+        errno.EISDIR,
+        errno.ELOOP,
+        errno.ENOENT,
+        errno.ENOTDIR,
+        errno.ENOTEMPTY,
+        errno.EPERM,
+    )
+}
+
 
-def raise_if_matches_directory_not_empty(error: pebble.Error, msg: str) -> None:
-    if (
-        isinstance(error, pebble.PathError)
-        and error.kind == 'generic-file-error'
-        and 'directory not empty' in error.message
-    ):
-        raise OSError(errno.ENOTEMPTY, os.strerror(errno.ENOTEMPTY), msg) from error
+def raise_directory_not_empty(msg: str, from_: BaseException | None = None) -> NoReturn:
+    raise OSError(errno.ENOTEMPTY, _STRERROR[errno.ENOTEMPTY], msg) from from_
 
 
 def raise_file_exists(msg: str, from_: BaseException | None = None) -> NoReturn:
-    e = FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), msg)
+    e = FileExistsError(errno.EEXIST, _STRERROR[errno.EEXIST], msg)
     raise e from from_
 
 
-def raise_if_matches_file_exists(error: pebble.Error, msg: str) -> None:
-    if (
-        isinstance(error, pebble.PathError)
-        and error.kind == 'generic-file-error'
-        and 'file exists' in error.message
-    ):
-        raise_file_exists(msg, from_=error)
-
-
 def raise_file_not_found(msg: str, from_: BaseException | None = None) -> NoReturn:
     # pebble will return this error when trying to read_{text,bytes} a socket
     # pathlib raises OSError(errno.ENXIO, os.strerror(errno.ENXIO), path) in this case
@@ -53,68 +58,108 @@ def raise_file_not_found(msg: str, from_: BaseException | None = None) -> NoRetu
     # since FileNotFoundError is a subtype of OSError, and this case should be rare
     # it seems sensible to just raise FileNotFoundError here, without checking
     # if the file in question is a socket
-    raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), msg) from from_
+    raise FileNotFoundError(errno.ENOENT, _STRERROR[errno.ENOENT], msg) from from_
 
 
-def raise_if_matches_file_not_found(error: pebble.Error, msg: str) -> None:
-    if (isinstance(error, pebble.APIError) and error.code == 404) or (
-        isinstance(error, pebble.PathError) and error.kind == 'not-found'
-    ):
-        raise_file_not_found(msg, from_=error)
+def raise_is_a_directory(msg: str, from_: BaseException | None = None) -> NoReturn:
+    raise IsADirectoryError(errno.EISDIR, _STRERROR[errno.EISDIR], msg) from from_
 
 
-def raise_is_a_directory(msg: str, from_: BaseException | None = None) -> None:
-    raise IsADirectoryError(errno.EISDIR, os.strerror(errno.EISDIR), msg) from from_
+def raise_lookup(msg: str, from_: BaseException | None = None) -> NoReturn:
+    raise LookupError(msg) from from_
 
 
-def raise_if_matches_is_a_directory(error: pebble.Error, msg: str) -> None:
-    if (
-        isinstance(error, pebble.PathError)
-        and error.kind == 'generic-file-error'
-        and 'can only read a regular file' in error.message
-    ):
-        raise_is_a_directory(msg, from_=error)
+def raise_not_a_directory(msg: str, from_: BaseException | None = None) -> NoReturn:
+    raise NotADirectoryError(errno.ENOTDIR, _STRERROR[errno.ENOTDIR], msg) from from_
 
 
-def raise_if_matches_lookup(error: pebble.Error, msg: str) -> None:
-    if (
-        isinstance(error, pebble.PathError)
-        and error.kind == 'generic-file-error'
-        and 'cannot look up user and group' in error.message
-    ):
-        raise LookupError(msg) from error
+def raise_permission(msg: str, from_: BaseException | None = None) -> NoReturn:
+    raise PermissionError(errno.EPERM, _STRERROR[errno.EPERM], msg) from from_
 
 
-def matches_not_a_directory(error: pebble.Error) -> bool:
-    return (
-        isinstance(error, pebble.APIError)
-        and error.code == 400
-        and 'not a directory' in error.message
-    ) or (
-        isinstance(error, pebble.PathError)
-        and error.kind == 'generic-file-error'
-        and 'not a directory' in error.message
-    )
+def raise_too_many_levels_of_symlinks(msg: str, from_: BaseException | None = None) -> NoReturn:
+    raise OSError(errno.ELOOP, _STRERROR[errno.ELOOP], msg) from from_
 
 
-def raise_not_a_directory(msg: str, from_: BaseException | None = None) -> NoReturn:
-    raise NotADirectoryError(errno.ENOTDIR, os.strerror(errno.ENOTDIR), msg) from from_
+# Pebble errors are dispatched on (type, kind, code), which is computed once per error.
+# Each key maps to (substring, raiser) pairs, where the error message must contain the
+# substring (or any message matches if it is None) for the raiser to be called.
+_TABLE: dict[
+    tuple[type[pebble.Error], str | None, int | None], Sequence[tuple[str | None, _Raiser]]
+] = {
+    (pebble.APIError, None, 400): (
+        ('not a directory', raise_not_a_directory),
+        ('too many levels of symbolic links', raise_too_many_levels_of_symlinks),
+    ),
+    (pebble.APIError, None, 404): ((None, raise_file_not_found),),
+    (pebble.PathError, 'generic-file-error', None): (
+        ('directory not empty', raise_directory_not_empty),
+        ('file exists', raise_file_exists),
+        ('can only read a regular file', raise_is_a_directory),
+        ('cannot look up user and group', raise_lookup),
+        ('not a directory', raise_not_a_directory),
+    ),
+    (pebble.PathError, 'not-found', None): ((None, raise_file_not_found),),
+    (pebble.PathError, 'permission-denied', None): ((None, raise_permission),),
+}
+
+
+def _find_raiser(
+    error: pebble.APIError | pebble.PathError, raisers: Sequence[_Raiser]
+) -> _Raiser | None:
+    # normalise subclasses to the table's types, as the lookup is by exact type
+    error_type = pebble.PathError if isinstance(error, pebble.PathError) else pebble.APIError
+    key = (error_type, getattr(error, 'kind', None), getattr(error, 'code', None))
+    for substring, raiser in _TABLE.get(key, ()):
+        if raiser in raisers and (substring is None or substring in error.message):
+            return raiser
+    return None
+
+
+def raise_if_matches(
+    error: pebble.APIError | pebble.PathError, msg: str, *raisers: _Raiser
+) -> None:
+    """Raise the Python equivalent of error, if it matches one of the given raisers."""
+    raiser = _find_raiser(error, raisers)
+    if raiser is not None:
+        raiser(msg, error)
+
+
+def raise_if_matches_directory_not_empty(
+    error: pebble.APIError | pebble.PathError, msg: str
+) -> None:
+    raise_if_matches(error, msg, raise_directory_not_empty)
+
+
+def raise_if_matches_file_exists(error: pebble.APIError | pebble.PathError, msg: str) -> None:
+    raise_if_matches(error, msg, raise_file_exists)
+
+
+def raise_if_matches_file_not_found(error: pebble.APIError | pebble.PathError, msg: str) -> None:
+    raise_if_matches(error, msg, raise_file_not_found)
+
+
+def raise_if_matches_is_a_directory(error: pebble.APIError | pebble.PathError, msg: str) -> None:
+    raise_if_matches(error, msg, raise_is_a_directory)
+
+
+def raise_if_matches_lookup(error: pebble.APIError | pebble.PathError, msg: str) -> None:
+    raise_if_matches(error, msg, raise_lookup)
+
+
+def matches_not_a_directory(error: pebble.APIError | pebble.PathError) -> bool:
+    return _find_raiser(error, (raise_not_a_directory,)) is not None
 
 
-def raise_if_matches_not_a_directory(error: pebble.Error, msg: str) -> None:
-    if matches_not_a_directory(error):
-        raise_not_a_directory(msg, from_=error)
+def raise_if_matches_not_a_directory(error: pebble.APIError | pebble.PathError, msg: str) -> None:
+    raise_if_matches(error, msg, raise_not_a_directory)
 
 
-def raise_if_matches_permission(error: pebble.Error, msg: str) -> None:
-    if isinstance(error, pebble.PathError) and error.kind == 'permission-denied':
-        raise PermissionError(errno.EPERM, os.strerror(errno.EPERM), msg) from error
+def raise_if_matches_permission(error: pebble.APIError | pebble.PathError, msg: str) -> None:
+    raise_if_matches(error, msg, raise_permission)
 
 
-def raise_if_matches_too_many_levels_of_symlinks(error: pebble.Error, msg: str) -> None:
-    if (
-        isinstance(error, pebble.APIError)
-        and error.code == 400
-        and 'too many levels of symbolic links' in error.message
-    ):
-        raise OSError(errno.ELOOP, os.strerror(errno.ELOOP), msg) from error
+def raise_if_matches_too_many_levels_of_symlinks(
+    error: pebble.APIError | pebble.PathError, msg: str
+) -> None:
+    raise_if_matches(error, msg, raise_too_many_levels_of_symlinks)
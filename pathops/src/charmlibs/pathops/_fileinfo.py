@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import contextlib
 import datetime
 import grp
 import pwd
@@ -28,6 +29,7 @@ from . import _errors
 
 if typing.TYPE_CHECKING:
     import pathlib
+    from typing import Generator
 
     from ._container_path import ContainerPath
 
@@ -43,7 +45,50 @@ _FT_MAP: dict[int, pebble.FileType] = {
 }
 
 
+# While caching, FileInfo for ContainerPaths keyed on (container name, path, follow_symlinks).
+_cache: dict[tuple[str, pathlib.PurePath, bool], pebble.FileInfo] | None = None
+
+
+@contextlib.contextmanager
+def cached() -> Generator[None]:
+    """Cache the results of :func:`from_container_path` until the context exits.
+
+    Entries are invalidated by :func:`invalidate`, which ContainerPath calls after modifying a
+    path. Nested use shares the outermost cache.
+    """
+    global _cache
+    if _cache is not None:
+        yield
+        return
+    _cache = {}
+    try:
+        yield
+    finally:
+        _cache = None
+
+
+def invalidate(path: ContainerPath) -> None:
+    """Drop any cached FileInfo for path and its ancestors, whose contents have changed."""
+    if _cache is None:
+        return
+    name = path._container.name
+    for p in (path._path, *path._path.parents):
+        _cache.pop((name, p, True), None)
+        _cache.pop((name, p, False), None)
+
+
 def from_container_path(path: ContainerPath, follow_symlinks: bool = True) -> pebble.FileInfo:
+    if _cache is None:
+        return _from_container_path(path, follow_symlinks=follow_symlinks)
+    key = (path._container.name, path._path, follow_symlinks)
+    info = _cache.get(key)
+    if info is None:
+        # errors, including FileNotFoundError, are never cached
+        info = _cache[key] = _from_container_path(path, follow_symlinks=follow_symlinks)
+    return info
+
+
+def _from_container_path(path: ContainerPath, follow_symlinks: bool) -> pebble.FileInfo:
     if follow_symlinks:
         return _get_fileinfo_directly(path)
     return _get_fileinfo_from_parent(path)
@@ -53,11 +98,14 @@ def _get_fileinfo_directly(path: ContainerPath) -> pebble.FileInfo:
     try:
         info_list = path._container.list_files(path._path, itself=True)
     except (pebble.APIError, pebble.PathError) as e:
-        msg = repr(path)
-        _errors.raise_if_matches_file_not_found(e, msg=msg)
-        _errors.raise_if_matches_not_a_directory(e, msg=msg)
-        _errors.raise_if_matches_permission(e, msg=msg)
-        _errors.raise_if_matches_too_many_levels_of_symlinks(e, msg=msg)
+        _errors.raise_if_matches(
+            e,
+            repr(path),
+            _errors.raise_file_not_found,
+            _errors.raise_not_a_directory,
+            _errors.raise_permission,
+            _errors.raise_too_many_levels_of_symlinks,
+        )
         raise
     assert len(info_list) == 1, 'ops.Container.list_files with itself=True returns 1 item'
     return info_list[0]
@@ -67,9 +115,9 @@ def _get_fileinfo_from_parent(path: ContainerPath) -> pebble.FileInfo:
     try:
         info_list = path._container.list_files(path._path.parent, pattern=path.name)
     except (pebble.APIError, pebble.PathError) as e:
-        msg = repr(path)
-        _errors.raise_if_matches_file_not_found(e, msg=msg)
-        _errors.raise_if_matches_permission(e, msg=msg)
+        _errors.raise_if_matches(
+            e, repr(path), _errors.raise_file_not_found, _errors.raise_permission
+        )
         raise
     if not info_list:
         _errors.raise_file_not_found(repr(path))
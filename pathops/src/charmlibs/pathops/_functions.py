@@ -16,7 +16,12 @@
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import io
+import os
 import pathlib
+import stat
 import typing
 
 from . import _constants, _fileinfo
@@ -24,8 +29,7 @@ from ._container_path import ContainerPath
 from ._local_path import LocalPath
 
 if typing.TYPE_CHECKING:
-    import os
-    from typing import BinaryIO, TextIO
+    from typing import BinaryIO, Generator, TextIO
 
     from ops import pebble
     from typing_extensions import TypeIs
@@ -33,9 +37,14 @@ if typing.TYPE_CHECKING:
     from ._types import PathProtocol
 
 
+_CHUNK_SIZE = 1 << 16  # 64 KiB
+_LARGE_CHUNK_SIZE = 1 << 20  # 1 MiB, used when comparing files at least this large
+_PATH_TYPES = (ContainerPath, LocalPath)
+
+
 def ensure_contents(
     path: str | os.PathLike[str] | PathProtocol,
-    source: bytes | str | BinaryIO | TextIO,
+    source: bytes | bytearray | memoryview | str | BinaryIO | TextIO,
     *,
     mode: int = _constants.DEFAULT_WRITE_MODE,
     user: str | None = None,
@@ -48,8 +57,9 @@ def ensure_contents(
 
     Args:
         path: A local or remote filesystem path.
-        source: The desired contents in ``str`` or ``bytes`` form, or an object with a ``.read()``
-            method which returns a ``str`` or ``bytes`` object.
+        source: The desired contents in ``str`` or ``bytes`` form (or a :class:`bytearray` or
+            :class:`memoryview`), or an object with a ``.read()`` method which returns a ``str``
+            or ``bytes`` object.
         mode: The desired file permissions.
         user: The desired file owner, or ``None`` to not change the owner.
         group: The desired group, or ``None`` to not change the group.
@@ -63,28 +73,71 @@ def ensure_contents(
         PermissionError: if the user does not have permissions for the operation.
         :class:`PebbleConnectionError`: if the remote Pebble client cannot be reached.
     """
-    if _is_str_pathlike(path):
-        path = LocalPath(path)
-    source = _as_bytes(source)
+    path = _coerce(path)
     try:
-        info = _get_fileinfo(path)
-    except FileNotFoundError:
-        pass  # file doesn't exist, so writing is required
-    else:  # check if metadata and contents already match
-        if (
-            (info.permissions == mode)
-            and (user is None or info.user == user)
-            and (group is None or info.group == group)
-            and (path.read_bytes() == source)
-        ):
+        source, matches = _compare(path, source, mode=mode, user=user, group=group)
+        if matches:
             return False  # everything matches, so writing is not required
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_bytes(source, mode=mode, user=user, group=group)
+    except FileNotFoundError:
+        # file doesn't exist, so writing is required, and the parent may need creating
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(path, LocalPath) and _copy_regular_file(path, source, mode, user, group):
+            return True
+    path.write_bytes(_as_bytes(source), mode=mode, user=user, group=group)
     return True
 
 
+def is_pathprotocol(obj: object) -> TypeIs[PathProtocol]:
+    """Return whether ``obj`` is an instance of a :class:`PathProtocol` implementation.
+
+    This is ``True`` for :class:`ContainerPath` and :class:`LocalPath` instances (including
+    subclasses), and ``False`` for anything else, including other :class:`os.PathLike` objects.
+    It checks a class attribute, rather than the protocol's members.
+    """
+    return getattr(type(obj), '_is_pathprotocol', False)
+
+
+@contextlib.contextmanager
+def batch() -> Generator[None]:
+    """Cache file metadata fetched from Pebble until the ``with`` block exits.
+
+    Within the block, :class:`ContainerPath` remembers the metadata of each path it looks up,
+    so repeated checks of the same path (e.g. calling :func:`ensure_contents` for a file that
+    was already checked or written) don't each make a Pebble request. The cached metadata for
+    a path and its parents is discarded when the path is written, created, or removed using
+    :class:`ContainerPath` methods.
+
+    Only use this when nothing else modifies the container's filesystem during the block,
+    including writes through symlinks or other paths to the same file, as such changes won't
+    be seen. Batches may be nested, in which case the outermost batch's cache is used.
+    :class:`LocalPath` metadata is never cached.
+
+    ::
+
+        with pathops.batch():
+            for name, contents in configs.items():
+                pathops.ensure_contents(root / name, contents)
+    """
+    with _fileinfo.cached():
+        yield
+
+
+def _coerce(path: str | os.PathLike[str] | PathProtocol) -> PathProtocol:
+    """Return path unchanged if it's a ContainerPath or LocalPath, otherwise as a LocalPath."""
+    if isinstance(path, _PATH_TYPES):  # the common case, checked first
+        return path
+    if _is_str_pathlike(path):
+        return LocalPath(path)
+    return path
+
+
 def _is_str_pathlike(obj: object) -> TypeIs[str | os.PathLike[str]]:
-    return isinstance(obj, str) or hasattr(obj, '__fspath__')
+    return _is_str_pathlike_type(type(obj))
+
+
+@functools.lru_cache(maxsize=64)
+def _is_str_pathlike_type(cls: type) -> bool:
+    return issubclass(cls, str) or hasattr(cls, '__fspath__')
 
 
 def _get_fileinfo(
@@ -92,13 +145,125 @@ def _get_fileinfo(
 ) -> pebble.FileInfo:
     if isinstance(path, ContainerPath):
         return _fileinfo.from_container_path(path, follow_symlinks=follow_symlinks)
-    assert _is_str_pathlike(path)
-    return _fileinfo.from_pathlib_path(pathlib.Path(path), follow_symlinks=follow_symlinks)
+    if not isinstance(path, pathlib.Path):
+        assert _is_str_pathlike(path)
+        path = pathlib.Path(path)
+    return _fileinfo.from_pathlib_path(path, follow_symlinks=follow_symlinks)
+
+
+def _compare(
+    path: PathProtocol,
+    source: bytes | bytearray | memoryview | str | BinaryIO | TextIO,
+    mode: int,
+    user: str | None,
+    group: str | None,
+) -> tuple[bytes, bool]:
+    """Return ``source`` as bytes, and whether the file at ``path`` already matches it.
+
+    ``source`` is only read once the file is known to exist.
+
+    Raises:
+        FileNotFoundError: if the metadata lookup finds that the file doesn't exist, in which
+            case ``source`` hasn't been read.
+    """
+    # the contents are only read once the metadata matches, as a pull can't be cancelled
+    if isinstance(path, ContainerPath):
+        info = _fileinfo.from_container_path(path)
+    else:
+        assert isinstance(path, LocalPath)  # ensure_contents converts all other paths to LocalPath
+        info = _fileinfo.from_pathlib_path(path)
+    data = _as_bytes(source)
+    if not _metadata_matches(info, size=len(data), mode=mode, user=user, group=group):
+        return data, False
+    try:
+        if isinstance(path, ContainerPath):
+            with path._open(encoding=None) as f:
+                return data, _contents_equal(f, data)
+        with open(path, 'rb', buffering=0) as f:
+            return data, _contents_equal(f, data)
+    except FileNotFoundError:
+        # removed since the lookup (or the batch() cache is stale), and source is already read
+        return data, False
+
+
+def _copy_regular_file(
+    path: LocalPath,
+    source: bytes | bytearray | memoryview | str | BinaryIO | TextIO,
+    mode: int,
+    user: str | None,
+    group: str | None,
+) -> bool:
+    """Copy the rest of ``source`` to ``path``, if it is a binary file open on a regular file.
+
+    This avoids reading the contents into memory. Returns ``False`` without reading from
+    ``source`` if it can't be copied this way.
+    """
+    # only plain binary files, not wrappers like gzip.GzipFile that expose the fd of the
+    # underlying file, whose contents (and tell() offsets) differ from what they read
+    if type(source) is io.BufferedReader or type(source) is io.BufferedRandom:
+        if type(source.raw) is not io.FileIO:
+            return False
+    elif type(source) is not io.FileIO:
+        return False
+    try:
+        source.flush()  # the file may have been written to, and then seeked back to the start
+        fd = source.fileno()
+        offset = source.tell()  # accounts for any data already read ahead into a buffer
+        st = os.fstat(fd)
+    except (AttributeError, OSError):  # io.UnsupportedOperation is an OSError
+        return False
+    if not stat.S_ISREG(st.st_mode):
+        return False
+    size_hint = max(st.st_size - offset, 0)
+    copied = path._write_from_file(fd, offset, size_hint, mode=mode, user=user, group=group)
+    source.seek(offset + copied)  # leave source at the end, as reading it would
+    return True
+
+
+def _metadata_matches(
+    info: pebble.FileInfo, size: int, mode: int, user: str | None, group: str | None
+) -> bool:
+    # a single tuple comparison, where None for user or group means any value matches
+    return (
+        info.permissions,
+        info.size,
+        info.user if user is not None else None,
+        info.group if group is not None else None,
+    ) == (mode, size, user, group)
+
+
+def _contents_equal(f: BinaryIO, source: bytes) -> bool:
+    """Return whether reading the rest of ``f`` would return exactly ``source``.
+
+    The file is read in fixed size chunks, stopping at the first chunk that differs,
+    so a second full copy of the contents is never held in memory. Large files are read
+    in larger chunks, reducing the number of reads needed when the contents match.
+    """
+    chunk_size = _LARGE_CHUNK_SIZE if len(source) >= _LARGE_CHUNK_SIZE else _CHUNK_SIZE
+    offset = 0
+    for chunk in _iter_chunks(f, chunk_size):
+        if not source.startswith(chunk, offset):
+            return False
+        offset += len(chunk)
+    return offset == len(source)
+
+
+def _iter_chunks(f: BinaryIO, chunk_size: int) -> Generator[bytes | memoryview]:
+    if isinstance(f, (io.RawIOBase, io.BufferedIOBase)):
+        # read into a reused buffer, rather than allocating new bytes for every chunk
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        while n := f.readinto(buffer):
+            yield view[:n]
+        return
+    while chunk := f.read(chunk_size):
+        yield chunk
 
 
-def _as_bytes(source: bytes | str | BinaryIO | TextIO) -> bytes:
-    if isinstance(source, bytes):
+def _as_bytes(source: bytes | bytearray | memoryview | str | BinaryIO | TextIO) -> bytes:
+    if type(source) is bytes:  # fast path for the most common case
         return source
-    if isinstance(source, str):
-        return source.encode()
-    return _as_bytes(source.read())
+    while not isinstance(source, (bytes, bytearray, memoryview, str)):
+        source = source.read()
+    # bytes(source) returns source itself if it's already exactly bytes, rather than copying it
+    return source.encode() if isinstance(source, str) else bytes(source)
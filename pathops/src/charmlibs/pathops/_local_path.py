@@ -17,15 +17,26 @@
 from __future__ import annotations
 
 import grp
+import os
 import pathlib
 import pwd
 import shutil
+import sys
 import typing
 
 from . import _constants
 
 if typing.TYPE_CHECKING:
-    from typing_extensions import Buffer
+    from typing import BinaryIO
+
+    from typing_extensions import Buffer, Self
+
+    from ._container_path import ContainerPath
+    from ._types import PathProtocol
+
+
+_COPY_CHUNK_SIZE = 1 << 20  # 1 MiB
+_MAX_COPY_FILE_RANGE_COUNT = 1 << 30  # as in shutil, so counts fit in a 32-bit ssize_t
 
 
 class LocalPath(pathlib.PosixPath):
@@ -44,6 +55,60 @@ class LocalPath(pathlib.PosixPath):
         LocalPath('/', 'foo')
     """
 
+    __slots__ = ()  # like pathlib's own classes, so instances don't need a __dict__
+
+    _is_pathprotocol = True  # see is_pathprotocol
+
+    def with_segments(self, *pathsegments: str | os.PathLike[str]) -> Self:
+        """Construct a new ``LocalPath`` from path-like objects.
+
+        This is a backport of :meth:`pathlib.PurePath.with_segments` from Python 3.12+, where
+        it is used to create all derived paths. On earlier versions, it is only provided for
+        compatibility with :class:`PathProtocol`.
+        """
+        return type(self)(*pathsegments)
+
+    def read_bytes_into(self, buffer: bytearray | memoryview) -> int:
+        """Read the corresponding local file into the provided buffer.
+
+        This method is not part of :class:`pathlib.Path`, and is provided for compatibility
+        with :class:`PathProtocol`. Up to ``len(buffer)`` bytes are read directly into
+        ``buffer``, without the intermediate :class:`bytes` object of :meth:`read_bytes`.
+
+        Returns:
+            The number of bytes read into ``buffer``.
+
+        Raises:
+            FileNotFoundError: if the path does not exist.
+            IsADirectoryError: if the path is a directory.
+            PermissionError: if the local user does not have permissions for the operation.
+        """
+        with self.open('rb') as f:
+            # buffered readinto keeps reading until the buffer is full or the file is exhausted
+            return f.readinto(buffer)
+
+    def copy_to(self, target: PathProtocol) -> int:
+        """Copy the contents of this file to ``target``, which may be any :class:`PathProtocol`.
+
+        This method is not part of :class:`pathlib.Path`, and is provided for compatibility
+        with :class:`PathProtocol`. It has the same effect as
+        ``target.write_bytes(self.read_bytes())``, but the contents are copied by the kernel
+        to a ``LocalPath``, and streamed to a :class:`ContainerPath`.
+
+        Returns:
+            The number of bytes copied.
+
+        Raises:
+            FileNotFoundError: if this path or the target's parent directory does not exist.
+            IsADirectoryError: if this path is a directory.
+            PermissionError: if the local or remote user does not have permissions for the
+                operation.
+            PebbleConnectionError: if the target is a :class:`ContainerPath` and the remote
+                Pebble client cannot be reached.
+        """
+        with self.open('rb') as f:
+            return copy_file_to(f, target)
+
     def write_bytes(
         self,
         data: Buffer,
@@ -93,6 +158,36 @@ class LocalPath(pathlib.PosixPath):
             self.chmod(mode)
         return bytes_written
 
+    def _write_from_file(
+        self,
+        fd: int,
+        offset: int,
+        size_hint: int,
+        *,
+        mode: int | None = None,
+        user: str | None = None,
+        group: str | None = None,
+    ) -> int:
+        """Like :meth:`write_bytes`, but copy the contents of ``fd`` from ``offset`` to its end.
+
+        ``size_hint`` is the expected number of bytes, such as the file's ``st_size``, but the
+        copy continues until the end of the file, since some files (e.g. in procfs) report a
+        size of zero. On Linux the bytes are copied by the kernel where possible, without
+        passing through Python.
+
+        Returns:
+            The number of bytes copied.
+        """
+        _validate_user_and_group(user=user, group=group)
+        if mode is None:
+            self.touch(mode=_constants.DEFAULT_WRITE_MODE)
+        with self.open('wb') as f:
+            bytes_written = _copy_file_range(fd, f, offset=offset, size_hint=size_hint)
+        _chown_if_needed(self, user=user, group=group)
+        if mode is not None:
+            self.chmod(mode)
+        return bytes_written
+
     def write_text(
         self,
         data: str,
@@ -207,6 +302,53 @@ class LocalPath(pathlib.PosixPath):
             _chown_if_needed(self, user=user, group=group)
 
 
+def copy_file_to(f: BinaryIO, target: PathProtocol) -> int:
+    """Write the whole of the open file ``f`` to ``target``, as :meth:`LocalPath.copy_to` does."""
+    if getattr(type(target), '_is_pathprotocol', False):
+        # LocalPath and ContainerPath can both write straight from a file descriptor
+        target = typing.cast('LocalPath | ContainerPath', target)
+        fd = f.fileno()
+        st = os.fstat(fd)
+        if isinstance(target, LocalPath) and _is_same_file(st, target):
+            # opening the target for writing would truncate the source, so leave it as it is
+            return st.st_size
+        return target._write_from_file(fd, 0, st.st_size)
+    return target.write_bytes(f.read())
+
+
+def _is_same_file(st: os.stat_result, path: LocalPath) -> bool:
+    try:
+        return os.path.samestat(st, path.stat())
+    except FileNotFoundError:
+        return False
+
+
+def _copy_file_range(fd: int, f: BinaryIO, offset: int, size_hint: int) -> int:
+    copied = 0
+    if sys.platform == 'linux' and hasattr(os, 'copy_file_range'):  # needs glibc 2.27+
+        # like shutil's fast copies, request at least a chunk at a time, and read until EOF
+        count = min(max(size_hint, _COPY_CHUNK_SIZE), _MAX_COPY_FILE_RANGE_COUNT)
+        while True:
+            try:
+                n = os.copy_file_range(fd, f.fileno(), count, offset_src=offset + copied)
+            except OSError:
+                # e.g. an older kernel, or filesystems that don't support copying between them
+                if copied:
+                    raise
+                break
+            if not n:
+                break
+            copied += n
+        if copied:
+            return copied
+        # nothing copied, which may be a file like /proc/cpuinfo that reports a size of zero,
+        # and isn't supported by copy_file_range, so read it instead
+    while chunk := os.pread(fd, _COPY_CHUNK_SIZE, offset + copied):
+        f.write(chunk)
+        copied += len(chunk)
+    return copied
+
+
 def _validate_user_and_group(user: str | None, group: str | None):
     if user is not None:
         pwd.getpwnam(user)
@@ -22,23 +22,20 @@ from . import _constants
 
 if typing.TYPE_CHECKING:
     import os
-    from typing import Generator, Sequence
+    from typing import Iterator, Sequence
 
     from typing_extensions import Self
 
 
 # based on typeshed.stdlib.pathlib.PurePath
 # https://github.com/python/typeshed/blob/main/stdlib/pathlib.pyi#L29
-class PathProtocol(typing.Protocol):
-    """The protocol implemented by :class:`ContainerPath` and :class:`LocalPath`.
-
-    Use this class in type annotations where either :class:`ContainerPath` or
-    :class:`LocalPath` is acceptable. This will result in both correct type checking
-    and useful autocompletions.
+class PurePathProtocol(typing.Protocol):
+    """The pure path operations of :class:`PathProtocol`, which don't access the filesystem.
 
-    While using a union type will also give correct type checking results, it provides less
-    useful autocompletions, as most editors will autocomplete methods and attributes that *any*
-    of the union members have, rather than only those that *all* of the union members have.
+    Use this class in type annotations for code that only manipulates paths, such as joining
+    them or inspecting their parts, so that it also accepts any future path-like type that
+    doesn't support filesystem operations. :class:`PathProtocol` extends this protocol, so
+    :class:`ContainerPath` and :class:`LocalPath` implement it too.
 
     :class:`str` follows the :mod:`pathlib` convention and returns the string representation of
     the path. :class:`ContainerPath` return the string representation of the path in the remote
@@ -48,10 +45,19 @@ class PathProtocol(typing.Protocol):
     Comparison methods compare by path. A :class:`ContainerPath` is only comparable to another
     object if it is also a :class:`ContainerPath` on the same :class:`ops.Container`. If this is
     not the case, then equality is ``False`` and other comparisons are :class:`NotImplemented`.
+    All four ordering methods are declared so that type checkers accept every comparison
+    operator, but they must agree with each other. New implementers only need to define
+    ``__lt__`` and ``__eq__``, and can derive the rest with :func:`functools.total_ordering`.
 
     Protocol implementers are hashable.
+
+    Paths are immutable, so the properties derived from them, like :attr:`name` and
+    :attr:`suffix`, always return the same value for a given instance. Implementations may
+    compute them once and cache the result.
     """
 
+    __slots__ = ()
+
     #############################
     # protocol PurePath methods #
     #############################
@@ -77,6 +83,9 @@ class PathProtocol(typing.Protocol):
         .. note::
             ``__rtruediv__`` is currently not part of this protocol, as
             :class:`ContainerPath` objects only support absolute paths.
+
+        Most arguments are :class:`str`, so implementations that convert arguments themselves
+        should check for ``type(arg) is str`` before falling back to :func:`os.fspath`.
         """
         ...
 
@@ -109,6 +118,10 @@ class PathProtocol(typing.Protocol):
         If the pattern is relative, matching is done from the right; otherwise, the entire path is
         matched. The recursive wildcard ``'**'`` is **not** supported by this method. Matching is
         always case-sensitive.
+
+        Implementations may check simple patterns, such as ``'name'``, ``'*.suffix'`` and
+        ``'prefix*'``, with string comparisons instead of compiling the pattern, provided the
+        result is the same as :meth:`pathlib.PurePath.match`.
         """
         ...
 
@@ -147,12 +160,35 @@ class PathProtocol(typing.Protocol):
         .. warning::
             :class:`ContainerPath` is not :class:`os.PathLike`. A :class:`ContainerPath` instance
             is not a valid value for ``other``, and will result in an error.
+
+        Most arguments are :class:`str`, so implementations that convert arguments themselves
+        should check for ``type(arg) is str`` before falling back to :func:`os.fspath`.
+        """
+        ...
+
+    def with_segments(self, *pathsegments: str | os.PathLike[str]) -> Self:
+        """Return a new instance of the same type, with its path built from the arguments.
+
+        For :class:`ContainerPath`, the new instance has the same container. This is the
+        :mod:`pathlib` hook (Python 3.12+) used to derive new paths, and :class:`LocalPath`
+        provides it on earlier Python versions too.
+
+        Implementations should construct every derived path (from :meth:`__truediv__`,
+        :meth:`joinpath`, :meth:`with_name`, :meth:`with_suffix`, :attr:`parent`,
+        :attr:`parents`, :meth:`iterdir` and :meth:`glob`) through this method, so that
+        subclasses can customise all of them by overriding it.
         """
         ...
 
     @property
     def parents(self) -> Sequence[Self]:
-        """A sequence of this path's logical parents. Each parent is an instance of this type."""
+        """A sequence of this path's logical parents. Each parent is an instance of this type.
+
+        Implementations may return a lazy sequence, constructing each parent only when it is
+        indexed or iterated over, as :attr:`pathlib.PurePath.parents` does. Callers should only
+        rely on the :class:`~typing.Sequence` interface, and convert the result to a
+        :class:`tuple` before comparing or hashing it.
+        """
         ...
 
     @property
@@ -196,6 +232,35 @@ class PathProtocol(typing.Protocol):
         """
         ...
 
+
+class PathProtocol(PurePathProtocol, typing.Protocol):
+    """The protocol implemented by :class:`ContainerPath` and :class:`LocalPath`.
+
+    Use this class in type annotations where either :class:`ContainerPath` or
+    :class:`LocalPath` is acceptable. This will result in both correct type checking
+    and useful autocompletions.
+
+    While using a union type will also give correct type checking results, it provides less
+    useful autocompletions, as most editors will autocomplete methods and attributes that *any*
+    of the union members have, rather than only those that *all* of the union members have.
+
+    This protocol extends :class:`PurePathProtocol` with methods that access the filesystem.
+    Prefer :class:`PurePathProtocol` in annotations where only pure path operations are used.
+
+    Methods that query the filesystem, like :meth:`exists`, :meth:`is_dir` and :meth:`is_file`,
+    look up the path's metadata on every call, as it may have changed in the meantime. For
+    :class:`ContainerPath`, each lookup is a Pebble request. Use :func:`batch` to share lookups
+    of the same path, e.g. ``p.exists() and p.is_file()``, between calls.
+
+    This protocol is only for static type checking, and isn't :func:`typing.runtime_checkable`,
+    so ``isinstance(obj, PathProtocol)`` raises :class:`TypeError`. At runtime, use
+    :func:`is_pathprotocol` instead, which is much faster than a structural check of the
+    protocol's many members would be, e.g.
+    ``path = arg if is_pathprotocol(arg) else LocalPath(arg)``.
+    """
+
+    __slots__ = ()
+
     #########################
     # protocol Path methods #
     #########################
@@ -231,12 +296,55 @@ class PathProtocol(typing.Protocol):
         """
         ...
 
-    def iterdir(self) -> Generator[Self]:
+    def read_bytes_into(self, buffer: bytearray | memoryview) -> int:
+        """Read the start of the file into a caller-provided buffer, returning the byte count.
+
+        Reads up to ``len(buffer)`` bytes, stopping early only at the end of the file.
+        Unlike :meth:`read_bytes`, no intermediate :class:`bytes` object is allocated, so a
+        buffer sized from :meth:`stat` lets large files be read with a single copy.
+
+        This method is not part of the :class:`pathlib.Path` API.
+
+        Returns:
+            The number of bytes read into ``buffer``.
+
+        Raises:
+            FileNotFoundError: If this path does not exist.
+            PermissionError: If the local or remote user does not have read permissions.
+            PebbleConnectionError: If the remote container cannot be reached.
+        """
+        ...
+
+    def copy_to(self, target: PathProtocol) -> int:
+        """Copy the contents of the corresponding file to ``target``, returning the byte count.
+
+        The target may be any :class:`PathProtocol`, including one of a different type. The
+        effect is the same as ``target.write_bytes(self.read_bytes())``: an existing target
+        keeps its permissions and ownership, and a new one is created with mode 0o644.
+        Implementations may copy more efficiently when they know the target type, for example
+        letting the kernel copy between two local files, or streaming to Pebble from a file.
+
+        This method is not part of the :class:`pathlib.Path` API.
+
+        Returns:
+            The number of bytes copied.
+
+        Raises:
+            FileNotFoundError: If this path or the target's parent directory does not exist.
+            PermissionError: If the local or remote user does not have appropriate permissions.
+            PebbleConnectionError: If a remote container cannot be reached.
+        """
+        ...
+
+    def iterdir(self) -> Iterator[Self]:
         """Yield objects of the same type corresponding to the directory's contents.
 
         There are no guarantees about the order of the children. The special entries
         ``'.'`` and ``'..'`` are not included.
 
+        Implementations should fetch the directory listing in a single call, rather than one
+        call per entry, and construct each child lazily, as it is yielded.
+
         Raises:
             FileNotFoundError: If this path does not exist.
             NotADirectoryError: If this path is not a directory.
@@ -248,7 +356,7 @@ class PathProtocol(typing.Protocol):
     # NOTE: Not supported -- (Python 3.12) ``case_sensitive`` argument
     # NOTE: Not supported -- (Python 3.13) ``pattern`` can be path-like
     # NOTE: Not supported -- (Python 3.13) ``recurse_symlinks``
-    def glob(self, pattern: str) -> Generator[Self]:
+    def glob(self, pattern: str) -> Iterator[Self]:
         r"""Iterate over this directory and yield all paths matching the provided pattern.
 
         For example, ``path.glob('*.txt')``, ``path.glob('*/foo.txt')``.
@@ -257,6 +365,10 @@ class PathProtocol(typing.Protocol):
             Recursive matching, using the ``'**'`` pattern, is not supported by
             :meth:`ContainerPath.glob`.
 
+        Implementations should traverse intermediate directories using strings (or the file
+        metadata they already have), and only construct instances of this type for the yielded
+        matches, rather than for every directory visited.
+
         Args:
             pattern: Must be relative, meaning it cannot begin with ``'/'``.
                 Matching is case-sensitive.
@@ -591,13 +703,6 @@ class PathProtocol(typing.Protocol):
 # to ease compatibility with pathlib.Path on 3.9+
 # could be added to the protocol if we're happy for LocalPath to double as backports
 
-# def with_segments(self, *pathsegments: _StrPath) -> Self: ...
-# required for 3.12+ subclassing machinery
-# not part of the protocol (otherwise LocalPath would have to backport it)
-# but it is a useful method -- given a ContainerPath with some container,
-# you can make another path with the same container cleanly, so it'll be implemented
-# on ContainerPath
-
 # @property
 # def drive(self) -> str: ...
 # will always be '' for Posix -- maybe drop it from the protocol
@@ -24,7 +24,12 @@ import pytest
 
 import utils
 from charmlibs.pathops import ContainerPath, LocalPath, _constants, ensure_contents
-from charmlibs.pathops._functions import _get_fileinfo
+from charmlibs.pathops._functions import (
+    _CHUNK_SIZE,
+    _LARGE_CHUNK_SIZE,
+    _contents_equal,
+    _get_fileinfo,
+)
 
 if typing.TYPE_CHECKING:
     from typing import Literal
@@ -80,6 +85,37 @@ def test_ensure_contents(
     assert info.permissions == mode
 
 
+@pytest.mark.parametrize(
+    'source',
+    [
+        b'',
+        b'x',
+        b'y' * _CHUNK_SIZE,
+        b'x' * (_CHUNK_SIZE * 2 + 1),
+        b'y' + b'x' * (_CHUNK_SIZE * 2),
+        b'x' * (_CHUNK_SIZE * 2) + b'y',
+        b'x' * _CHUNK_SIZE * 3,
+        b'x' * _LARGE_CHUNK_SIZE,
+    ],
+)
+@pytest.mark.parametrize('path_type', [LocalPath, ContainerPath])
+def test_contents_equal(
+    tmp_path: pathlib.Path,
+    container: ops.Container,
+    path_type: type[LocalPath] | type[ContainerPath],
+    source: bytes,
+):
+    contents = b'x' * (_CHUNK_SIZE * 2 + 1)
+    path = tmp_path / 'path'
+    path.write_bytes(contents)
+    if issubclass(path_type, ContainerPath):
+        f = ContainerPath(path, container=container)._open(encoding=None)
+    else:
+        f = path_type(path).open('rb')
+    with f:
+        assert _contents_equal(f, source) == (source == contents)
+
+
 @pytest.mark.parametrize('follow_symlinks', [True, False])
 @pytest.mark.parametrize('filename', utils.FILENAMES_PLUS)
 def test_get_fileinfo(
@@ -16,7 +16,7 @@
 
 import pathlib
 
-from charmlibs.pathops import ContainerPath, LocalPath, PathProtocol
+from charmlibs.pathops import ContainerPath, LocalPath, PathProtocol, PurePathProtocol
 
 
 def _requires_path(p: pathlib.Path) -> None: ...
@@ -25,6 +25,9 @@ def _requires_path(p: pathlib.Path) -> None: ...
 def _requires_protocol(p: PathProtocol) -> None: ...
 
 
+def _requires_pure_protocol(p: PurePathProtocol) -> None: ...
+
+
 def typecheck_container_path_implements_protocol(path: ContainerPath) -> None:
     _requires_protocol(path)
 
@@ -33,5 +36,17 @@ def typecheck_local_path_implemnents_protocol(path: LocalPath) -> None:
     _requires_protocol(path)
 
 
+def typecheck_protocol_implements_pure_protocol(path: PathProtocol) -> None:
+    _requires_pure_protocol(path)
+
+
+def typecheck_container_path_implements_pure_protocol(path: ContainerPath) -> None:
+    _requires_pure_protocol(path)
+
+
+def typecheck_local_path_implements_pure_protocol(path: LocalPath) -> None:
+    _requires_pure_protocol(path)
+
+
 def typecheck_local_path_is_pathlib_path(path: LocalPath) -> None:
     _requires_path(path)
@@ -16,8 +16,11 @@
 
 from __future__ import annotations
 
+import fnmatch
+import io
 import operator
 import pathlib
+import posixpath
 import typing
 
 import ops
@@ -25,7 +28,14 @@ import pytest
 from ops import pebble
 
 import utils
-from charmlibs.pathops import ContainerPath, LocalPath, RelativePathError, _constants, _fileinfo
+from charmlibs.pathops import (
+    ContainerPath,
+    LocalPath,
+    RelativePathError,
+    _constants,
+    _fileinfo,
+    batch,
+)
 
 if typing.TYPE_CHECKING:
     from typing import Any, Callable
@@ -181,7 +191,28 @@ def test_is_absolute(container: ops.Container):
 
 class TestMatch:
     @pytest.mark.parametrize('path_str', ('/', '/foo', '/foo/bar.txt', '/foo/bar_txt'))
-    @pytest.mark.parametrize('pattern', ('', '*', '**/bar', '/foo/bar*', '*.txt', '/FoO/bAr.txt'))
+    @pytest.mark.parametrize(
+        'pattern',
+        (
+            '',
+            '.',
+            '*',
+            '**/bar',
+            '/foo/bar*',
+            '*.txt',
+            '/FoO/bAr.txt',
+            'bar.txt',
+            'BAR.txt',
+            'bar*',
+            'b*txt',
+            'bar.txt*',
+            '*bar.txt',
+            'b?r.txt',
+            '[bf]*',
+            '*.*',
+            'foo',
+        ),
+    )
     def test_ok(self, path_str: str, pattern: str, container: ops.Container):
         container_path = ContainerPath(path_str, container=container)
         pathlib_path = pathlib.Path(path_str)
@@ -260,6 +291,9 @@ def test_parents(container: ops.Container):
     container_path = ContainerPath(path, container=container)
     container_result = tuple(str(p) for p in container_path.parents)
     assert container_result == pathlib_result
+    parents = container_path.parents
+    assert parents == tuple(container_path.with_segments(p) for p in path.parents)
+    assert hash(parents) == hash(container_path.parents)
 
 
 def test_parent(container: ops.Container):
@@ -300,6 +334,8 @@ def test_suffixes(container: ops.Container):
     container_path = ContainerPath(path, container=container)
     container_result = container_path.suffixes
     assert container_result == pathlib_result
+    container_result.append('.mutated')
+    assert container_path.suffixes == pathlib_result
 
 
 def test_stem(container: ops.Container):
@@ -327,6 +363,7 @@ def test_exists_reraises_unhandled_os_error(
     ('path_method', 'container_method', 'args', 'kwargs'),
     (
         ('read_bytes', 'pull', (), {}),
+        ('read_bytes_into', 'pull', (bytearray(1),), {}),
         ('read_text', 'pull', (), {}),
         ('is_symlink', 'list_files', (), {}),
         ('rmdir', 'list_files', (), {}),
@@ -389,3 +426,168 @@ def test_methods_handle_or_reraise_pebble_errors(
 def test_not_provided(attr: str):
     assert hasattr(pathlib.Path, attr)
     assert not hasattr(ContainerPath, attr)
+
+
+class TestGlob:
+    FILES: typing.ClassVar[dict[str, pebble.FileType]] = {
+        '/root': pebble.FileType.DIRECTORY,
+        '/root/a': pebble.FileType.DIRECTORY,
+        '/root/a/x.txt': pebble.FileType.FILE,
+        '/root/a/y.md': pebble.FileType.FILE,
+        '/root/b': pebble.FileType.DIRECTORY,
+        '/root/b/x.txt': pebble.FileType.FILE,
+        '/root/c.txt': pebble.FileType.FILE,
+        '/root/link': pebble.FileType.SYMLINK,
+    }
+    LINKS: typing.ClassVar[dict[str, str]] = {'/root/link': '/root/a'}
+
+    @pytest.fixture
+    def itself_calls(self, monkeypatch: pytest.MonkeyPatch, container: ops.Container) -> list[str]:
+        itself_calls: list[str] = []
+
+        def list_files(
+            path: object, *, pattern: str | None = None, itself: bool = False
+        ) -> list[pebble.FileInfo]:
+            path = str(path)
+            target = self.LINKS.get(path, path)
+            if target not in self.FILES:
+                raise pebble.APIError(body={}, code=404, status='', message='')
+            if itself:
+                itself_calls.append(path)
+                return [utils.make_fileinfo(path, filetype=self.FILES[target])]
+            return [
+                utils.make_fileinfo(posixpath.join(path, posixpath.basename(p)), filetype=t)
+                for p, t in self.FILES.items()
+                if posixpath.dirname(p) == target
+                and fnmatch.fnmatchcase(posixpath.basename(p), pattern or '*')
+            ]
+
+        monkeypatch.setattr(container, 'list_files', list_files)
+        return itself_calls
+
+    @pytest.mark.parametrize(
+        ('pattern', 'expected'),
+        (
+            ('*.txt', ['/root/c.txt']),
+            ('*/x.txt', ['/root/a/x.txt', '/root/b/x.txt', '/root/link/x.txt']),
+            ('[ab]*/x.txt', ['/root/a/x.txt', '/root/b/x.txt']),
+            ('l*/y.md', ['/root/link/y.md']),
+            ('a/*', ['/root/a/x.txt', '/root/a/y.md']),
+            ('*/*/x.txt', []),
+            ('missing/*', []),
+            ('c.txt/*', []),
+        ),
+    )
+    def test_matches(
+        self, container: ops.Container, itself_calls: list[str], pattern: str, expected: list[str]
+    ):
+        root = ContainerPath('/root', container=container)
+        assert sorted(str(p) for p in root.glob(pattern)) == expected
+
+    def test_only_symlinks_are_checked_for_being_directories(
+        self, container: ops.Container, itself_calls: list[str]
+    ):
+        root = ContainerPath('/root', container=container)
+        list(root.glob('*/x.txt'))
+        assert itself_calls == ['/root', '/root/link']
+
+
+def test_batch_shares_lookups_between_queries(
+    monkeypatch: pytest.MonkeyPatch, container: ops.Container
+):
+    calls: list[str] = []
+
+    def list_files(path: object, **kwargs: object) -> list[pebble.FileInfo]:
+        calls.append(str(path))
+        return [utils.make_fileinfo(str(path))]
+
+    monkeypatch.setattr(container, 'list_files', list_files)
+    path = ContainerPath('/foo', container=container)
+    assert path.exists() and path.is_file() and not path.is_dir()
+    assert len(calls) == 3
+    calls.clear()
+    with batch():
+        assert path.exists() and path.is_file() and not path.is_dir()
+        assert ContainerPath('/foo', container=container).is_file()
+    assert calls == ['/foo']
+
+
+class TestIterdir:
+    def test_lists_directory_once(self, monkeypatch: pytest.MonkeyPatch, container: ops.Container):
+        calls: list[tuple[str, dict[str, object]]] = []
+
+        def list_files(path: object, **kwargs: object) -> list[pebble.FileInfo]:
+            calls.append((str(path), kwargs))
+            if kwargs.get('itself'):
+                return [utils.make_fileinfo(str(path), filetype=pebble.FileType.DIRECTORY)]
+            return [utils.make_fileinfo(f'{path}/{name}') for name in ('a', 'b', 'c')]
+
+        monkeypatch.setattr(container, 'list_files', list_files)
+        children = ContainerPath('/foo', container=container).iterdir()
+        assert calls == [('/foo', {'itself': True}), ('/foo', {})]
+        assert [str(p) for p in children] == ['/foo/a', '/foo/b', '/foo/c']
+        assert len(calls) == 2
+
+    def test_not_a_directory_raised_on_call(
+        self, monkeypatch: pytest.MonkeyPatch, container: ops.Container
+    ):
+        def list_files(path: object, **kwargs: object) -> list[pebble.FileInfo]:
+            return [utils.make_fileinfo(str(path))]
+
+        monkeypatch.setattr(container, 'list_files', list_files)
+        with pytest.raises(NotADirectoryError):
+            ContainerPath('/foo', container=container).iterdir()
+
+
+@pytest.mark.parametrize(('size', 'expected'), ((3, b'abc'), (8, b'abcdef\0\0')))
+def test_read_bytes_into(
+    monkeypatch: pytest.MonkeyPatch, container: ops.Container, size: int, expected: bytes
+):
+    monkeypatch.setattr(container, 'pull', lambda path, encoding: io.BytesIO(b'abcdef'))
+    buffer = bytearray(size)
+    n = ContainerPath('/foo', container=container).read_bytes_into(buffer)
+    assert n == min(size, 6)
+    assert buffer == expected
+
+
+class TestCopyTo:
+    def test_to_local_path(
+        self, monkeypatch: pytest.MonkeyPatch, container: ops.Container, tmp_path: pathlib.Path
+    ):
+        pulled = tmp_path / 'pulled'
+        pulled.write_bytes(b'contents')
+        monkeypatch.setattr(container, 'pull', lambda path, encoding: pulled.open('rb'))
+        target = LocalPath(tmp_path, 'target')
+        assert ContainerPath('/foo', container=container).copy_to(target) == len(b'contents')
+        assert target.read_bytes() == b'contents'
+
+    def test_from_local_path_streams_file(
+        self, monkeypatch: pytest.MonkeyPatch, container: ops.Container, tmp_path: pathlib.Path
+    ):
+        pushed: list[bytes] = []
+
+        def push(path: object, source: typing.BinaryIO, **kwargs: object) -> None:
+            assert not isinstance(source, bytes)
+            pushed.append(source.read())
+
+        monkeypatch.setattr(container, 'list_files', utils.raise_not_found_path_error)
+        monkeypatch.setattr(container, 'push', push)
+        source = LocalPath(tmp_path, 'source')
+        source.write_bytes(b'contents')
+        assert source.copy_to(ContainerPath('/foo', container=container)) == len(b'contents')
+        assert pushed == [b'contents']
+
+    @pytest.mark.skipif(not pathlib.Path('/proc/self/status').exists(), reason='requires procfs')
+    def test_from_file_reporting_zero_size(
+        self, monkeypatch: pytest.MonkeyPatch, container: ops.Container
+    ):
+        pushed: list[bytes] = []
+        monkeypatch.setattr(container, 'list_files', utils.raise_not_found_path_error)
+        monkeypatch.setattr(
+            container, 'push', lambda path, source, **_: pushed.append(source.read())
+        )
+        source = LocalPath('/proc/self/status')
+        assert source.stat().st_size == 0
+        n = source.copy_to(ContainerPath('/foo', container=container))
+        assert pushed[0].startswith(b'Name:')
+        assert n == len(pushed[0])
@@ -0,0 +1,137 @@
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for matching Pebble errors to Python exceptions."""
+
+from __future__ import annotations
+
+import errno
+import typing
+
+import pytest
+from ops import pebble
+
+from charmlibs.pathops import _errors
+
+if typing.TYPE_CHECKING:
+    from typing import Callable
+
+
+def _api_error(code: int, message: str) -> pebble.APIError:
+    return pebble.APIError(body={}, code=code, status='', message=message)
+
+
+@pytest.mark.parametrize(
+    ('matcher', 'error', 'expected'),
+    (
+        (
+            _errors.raise_if_matches_directory_not_empty,
+            pebble.PathError('generic-file-error', 'directory not empty'),
+            OSError,
+        ),
+        (
+            _errors.raise_if_matches_file_exists,
+            pebble.PathError('generic-file-error', 'mkdir /foo: file exists'),
+            FileExistsError,
+        ),
+        (_errors.raise_if_matches_file_not_found, _api_error(404, ''), FileNotFoundError),
+        (
+            _errors.raise_if_matches_file_not_found,
+            pebble.PathError('not-found', ''),
+            FileNotFoundError,
+        ),
+        (
+            _errors.raise_if_matches_is_a_directory,
+            pebble.PathError('generic-file-error', 'can only read a regular file'),
+            IsADirectoryError,
+        ),
+        (
+            _errors.raise_if_matches_lookup,
+            pebble.PathError('generic-file-error', 'cannot look up user and group'),
+            LookupError,
+        ),
+        (
+            _errors.raise_if_matches_not_a_directory,
+            _api_error(400, 'stat /foo/bar: not a directory'),
+            NotADirectoryError,
+        ),
+        (
+            _errors.raise_if_matches_not_a_directory,
+            pebble.PathError('generic-file-error', 'not a directory'),
+            NotADirectoryError,
+        ),
+        (
+            _errors.raise_if_matches_permission,
+            pebble.PathError('permission-denied', ''),
+            PermissionError,
+        ),
+        (
+            _errors.raise_if_matches_too_many_levels_of_symlinks,
+            _api_error(400, 'too many levels of symbolic links'),
+            OSError,
+        ),
+    ),
+)
+def test_matching_error_is_raised(
+    matcher: Callable[[pebble.APIError | pebble.PathError, str], None],
+    error: pebble.APIError | pebble.PathError,
+    expected: type[Exception],
+):
+    with pytest.raises(expected) as ctx:
+        matcher(error, 'msg')
+    assert ctx.value.__cause__ is error
+
+
+@pytest.mark.parametrize(
+    'error',
+    (
+        _api_error(400, 'unknown-message'),
+        _api_error(500, 'not a directory'),
+        pebble.PathError('generic-file-error', 'unknown-message'),
+        pebble.PathError('unknown-kind', 'not a directory'),
+    ),
+)
+def test_non_matching_error_is_not_raised(error: pebble.APIError | pebble.PathError):
+    _errors.raise_if_matches_not_a_directory(error, 'msg')
+    assert not _errors.matches_not_a_directory(error)
+    _errors.raise_if_matches_file_not_found(error, 'msg')
+    _errors.raise_if_matches_permission(error, 'msg')
+
+
+def test_errno_is_set():
+    with pytest.raises(OSError) as ctx:
+        _errors.raise_if_matches_too_many_levels_of_symlinks(
+            _api_error(400, 'too many levels of symbolic links'), 'msg'
+        )
+    assert ctx.value.errno == errno.ELOOP
+
+
+class _APIErrorSubclass(pebble.APIError):
+    pass
+
+
+class _PathErrorSubclass(pebble.PathError):
+    pass
+
+
+@pytest.mark.parametrize(
+    'error',
+    (
+        _APIErrorSubclass(body={}, code=404, status='', message=''),
+        _PathErrorSubclass('not-found', ''),
+    ),
+)
+def test_subclass_is_matched(error: pebble.APIError | pebble.PathError):
+    with pytest.raises(FileNotFoundError):
+        _errors.raise_if_matches_file_not_found(error, 'msg')
@@ -16,6 +16,13 @@
 
 from __future__ import annotations
 
+import bz2
+import contextlib
+import errno
+import gzip
+import io
+import lzma
+import pathlib
 import typing
 
 import ops
@@ -23,11 +30,27 @@ import pytest
 from ops import pebble
 
 import utils
-from charmlibs.pathops import ContainerPath
-from charmlibs.pathops._functions import _get_fileinfo
+from charmlibs.pathops import (
+    ContainerPath,
+    LocalPath,
+    _constants,
+    _fileinfo,
+    _local_path,
+    batch,
+    ensure_contents,
+    is_pathprotocol,
+)
+from charmlibs.pathops._functions import (
+    _CHUNK_SIZE,
+    _LARGE_CHUNK_SIZE,
+    _as_bytes,
+    _coerce,
+    _contents_equal,
+    _get_fileinfo,
+)
 
 if typing.TYPE_CHECKING:
-    from typing import Any, Callable
+    from typing import Any, BinaryIO, Callable
 
 
 @pytest.mark.parametrize(
@@ -46,3 +69,251 @@ def test_get_fileinfo_reraises_unhandled_pebble_errors(
     monkeypatch.setattr(container, 'list_files', mock)
     with pytest.raises(error):
         _get_fileinfo(ContainerPath('/', container=container))
+
+
+class _Bytes(bytes):
+    pass
+
+
+class _Reader:
+    def __init__(self, source: object):
+        self._source = source
+
+    def read(self) -> object:
+        return self._source
+
+
+@pytest.mark.parametrize(
+    'source',
+    (
+        b'contents',
+        'contents',
+        _Bytes(b'contents'),
+        bytearray(b'contents'),
+        memoryview(b'contents'),
+        io.BytesIO(b'contents'),
+        io.StringIO('contents'),
+        _Reader(io.BytesIO(b'contents')),
+        _Reader(_Reader('contents')),
+    ),
+)
+def test_as_bytes(source: Any):
+    result = _as_bytes(source)
+    assert type(result) is bytes
+    assert result == b'contents'
+
+
+class _ChunkReader:
+    def __init__(self, contents: bytes):
+        self._file = io.BytesIO(contents)
+
+    def read(self, n: int) -> bytes:
+        return self._file.read(n)
+
+    def __enter__(self) -> _ChunkReader:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self._file.close()
+
+
+_CONTENTS = b'x' * (_CHUNK_SIZE * 2 + 1)
+
+
+@pytest.mark.parametrize(
+    'source',
+    (
+        b'',
+        b'x',
+        b'y' * _CHUNK_SIZE,
+        _CONTENTS,
+        b'y' + _CONTENTS[1:],
+        _CONTENTS[:-1] + b'y',
+        b'x' * _CHUNK_SIZE * 3,
+        b'x' * _LARGE_CHUNK_SIZE,
+    ),
+)
+@pytest.mark.parametrize('reader', ('file', 'bytes_io', 'chunk_reader'))
+def test_contents_equal(tmp_path: pathlib.Path, source: bytes, reader: str):
+    path = tmp_path / 'path'
+    path.write_bytes(_CONTENTS)
+    if reader == 'file':
+        f = path.open('rb', buffering=0)
+    elif reader == 'bytes_io':
+        f = io.BytesIO(_CONTENTS)
+    else:
+        f = typing.cast('BinaryIO', _ChunkReader(_CONTENTS))
+    with f:
+        assert _contents_equal(f, source) == (source == _CONTENTS)
+
+
+class TestEnsureContentsContainerPath:
+    @pytest.fixture
+    def pushed(self, monkeypatch: pytest.MonkeyPatch, container: ops.Container) -> list[bytes]:
+        pushed: list[bytes] = []
+        monkeypatch.setattr(container, 'push', lambda path, source, **_: pushed.append(source))
+        monkeypatch.setattr(container, 'make_dir', lambda *args, **kwargs: None)
+        return pushed
+
+    @pytest.mark.parametrize('mode', (_constants.DEFAULT_WRITE_MODE, 0o600))
+    @pytest.mark.parametrize('contents', (b'contents', b'different'))
+    def test_existing_file(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        container: ops.Container,
+        pushed: list[bytes],
+        contents: bytes,
+        mode: int,
+    ):
+        info = utils.make_fileinfo('/foo', size=len(contents), permissions=mode)
+        pulled: list[io.BytesIO] = []
+
+        def pull(*args: object, **kwargs: object) -> io.BytesIO:
+            pulled.append(io.BytesIO(contents))
+            return pulled[-1]
+
+        monkeypatch.setattr(container, 'list_files', lambda *args, **kwargs: [info])
+        monkeypatch.setattr(container, 'pull', pull)
+        path = ContainerPath('/foo', container=container)
+        changed = ensure_contents(path, b'contents', mode=_constants.DEFAULT_WRITE_MODE)
+        if contents == b'contents' and mode == _constants.DEFAULT_WRITE_MODE:
+            assert not changed
+            assert not pushed
+            assert pulled[0].closed
+        else:
+            assert changed
+            assert pushed == [b'contents']
+            assert not pulled  # the metadata differs, so the contents aren't needed
+
+    @pytest.mark.parametrize('batched', (False, True))
+    def test_batch(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        container: ops.Container,
+        pushed: list[bytes],
+        batched: bool,
+    ):
+        info = utils.make_fileinfo('/foo', size=3, permissions=_constants.DEFAULT_WRITE_MODE)
+        listed: list[str] = []
+
+        def list_files(path: object, **kwargs: object) -> list[pebble.FileInfo]:
+            listed.append(str(path))
+            return [info]
+
+        monkeypatch.setattr(container, 'list_files', list_files)
+        monkeypatch.setattr(container, 'pull', lambda *args, **kwargs: io.BytesIO(b'old'))
+        path = ContainerPath('/foo', container=container)
+        with batch() if batched else contextlib.nullcontext():
+            assert path.exists()
+            assert ensure_contents(path, b'new')
+            assert pushed == [b'new']
+            assert listed == (['/foo'] if batched else ['/foo'] * 3)
+            assert path.exists()  # the write invalidated the cached info
+            assert listed == (['/foo'] * 2 if batched else ['/foo'] * 4)
+        assert path.exists()
+        assert listed == (['/foo'] * 3 if batched else ['/foo'] * 5)
+
+    def test_missing_file(
+        self, monkeypatch: pytest.MonkeyPatch, container: ops.Container, pushed: list[bytes]
+    ):
+        pulled: list[object] = []
+        monkeypatch.setattr(container, 'list_files', utils.raise_not_found_path_error)
+        monkeypatch.setattr(container, 'pull', lambda *args, **kwargs: pulled.append(args))
+        path = ContainerPath('/foo', container=container)
+        assert ensure_contents(path, b'contents')
+        assert pushed == [b'contents']
+        assert not pulled
+
+    def test_file_removed_after_lookup(
+        self, monkeypatch: pytest.MonkeyPatch, container: ops.Container, pushed: list[bytes]
+    ):
+        info = utils.make_fileinfo('/foo', size=8, permissions=_constants.DEFAULT_WRITE_MODE)
+        monkeypatch.setattr(container, 'list_files', lambda *args, **kwargs: [info])
+        monkeypatch.setattr(container, 'pull', utils.raise_not_found_path_error)
+        path = ContainerPath('/foo', container=container)
+        assert ensure_contents(path, io.BytesIO(b'contents'))
+        assert pushed == [b'contents']
+
+
+def test_ensure_contents_local_file_removed_after_lookup(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
+):
+    path = LocalPath(tmp_path, 'path')
+    info = utils.make_fileinfo(str(path), size=8, permissions=_constants.DEFAULT_WRITE_MODE)
+    monkeypatch.setattr(_fileinfo, 'from_pathlib_path', lambda *args, **kwargs: info)
+    assert ensure_contents(path, io.BytesIO(b'contents'))
+    assert path.read_bytes() == b'contents'
+
+
+@pytest.mark.parametrize(
+    'copy_file_range_error', (None, errno.EXDEV, errno.EOPNOTSUPP, 'zero', 'missing')
+)
+@pytest.mark.parametrize('already_read', (0, 1, _CHUNK_SIZE + 1))
+def test_ensure_contents_copies_regular_file(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: pathlib.Path,
+    already_read: int,
+    copy_file_range_error: int | str | None,
+):
+    if copy_file_range_error == 'missing':  # e.g. built against an older glibc
+        monkeypatch.delattr(_local_path.os, 'copy_file_range', raising=False)
+    elif copy_file_range_error is not None:
+
+        def copy_file_range(*args: object, **kwargs: object) -> int:
+            if copy_file_range_error == 'zero':  # as for files like /proc/cpuinfo
+                return 0
+            raise OSError(copy_file_range_error, '')
+
+        monkeypatch.setattr(_local_path.os, 'copy_file_range', copy_file_range, raising=False)
+    contents = bytes(range(256)) * (_CHUNK_SIZE // 128)
+    source_path = tmp_path / 'source'
+    source_path.write_bytes(contents)
+    path = LocalPath(tmp_path, 'dir', 'path')
+    with source_path.open('rb') as source:
+        source.read(already_read)  # also fills the read buffer past the current position
+        assert ensure_contents(path, source, mode=0o600)
+        assert source.read() == b''
+    assert path.read_bytes() == contents[already_read:]
+    assert path.stat().st_mode & 0o777 == 0o600
+
+
+@pytest.mark.skipif(not pathlib.Path('/proc/self/status').exists(), reason='requires procfs')
+def test_ensure_contents_copies_file_reporting_zero_size(tmp_path: pathlib.Path):
+    source_path = pathlib.Path('/proc/self/status')
+    assert source_path.stat().st_size == 0
+    path = LocalPath(tmp_path, 'path')
+    with source_path.open('rb') as source:
+        assert ensure_contents(path, source)
+    assert path.read_bytes().startswith(b'Name:')
+
+
+@pytest.mark.parametrize('module', (bz2, gzip, lzma))
+def test_ensure_contents_reads_compressed_file(tmp_path: pathlib.Path, module: Any):
+    contents = b'contents' * 1500
+    compressed_path = tmp_path / 'source.compressed'
+    with module.open(compressed_path, 'wb') as f:
+        f.write(contents)
+    path = LocalPath(tmp_path, 'path')
+    with module.open(compressed_path, 'rb') as source:
+        assert ensure_contents(path, source)
+    assert path.read_bytes() == contents
+
+
+def test_is_pathprotocol(container: ops.Container):
+    assert is_pathprotocol(ContainerPath('/', container=container))
+    assert is_pathprotocol(LocalPath('/'))
+    assert not is_pathprotocol(ContainerPath)
+    assert not is_pathprotocol(LocalPath)
+    assert not is_pathprotocol(pathlib.Path('/'))
+    assert not is_pathprotocol('/')
+
+
+def test_coerce(container: ops.Container):
+    local_path = LocalPath('/foo')
+    container_path = ContainerPath('/foo', container=container)
+    assert _coerce(local_path) is local_path
+    assert _coerce(container_path) is container_path
+    for path in ('/foo', pathlib.Path('/foo'), pathlib.PurePath('/foo')):
+        coerced = _coerce(path)
+        assert type(coerced) is LocalPath
+        assert coerced == local_path
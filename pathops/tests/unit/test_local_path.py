@@ -149,3 +149,46 @@ def test_write_text_newline_value_error(tmp_path: pathlib.Path):
             path.write_text('', newline='bad')
     with pytest.raises(ValueError):
         LocalPath(path).write_text('', newline='bad')
+
+
+def test_with_segments():
+    path = LocalPath('/foo').with_segments('/bar', 'baz')
+    assert type(path) is LocalPath
+    assert path == LocalPath('/bar/baz')
+
+
+def test_read_bytes_into(tmp_path: pathlib.Path):
+    path = LocalPath(tmp_path, 'file')
+    path.write_bytes(b'abcdef')
+    buffer = bytearray(8)
+    assert path.read_bytes_into(memoryview(buffer)[:3]) == 3
+    assert path.read_bytes_into(buffer) == 6
+    assert buffer == b'abcdef\0\0'
+
+
+def test_copy_to(tmp_path: pathlib.Path):
+    source = LocalPath(tmp_path, 'source')
+    source.write_bytes(b'contents')
+    target = LocalPath(tmp_path, 'target')
+    target.write_bytes(b'old contents', mode=0o600)
+    assert source.copy_to(target) == len(b'contents')
+    assert target.read_bytes() == b'contents'
+    assert target.stat().st_mode & 0o777 == 0o600
+
+
+def test_copy_to_same_file(tmp_path: pathlib.Path):
+    path = LocalPath(tmp_path, 'file')
+    path.write_bytes(b'contents')
+    assert path.copy_to(path) == len(b'contents')
+    assert path.copy_to(LocalPath(tmp_path, '.', 'file')) == len(b'contents')
+    assert path.read_bytes() == b'contents'
+
+
+@pytest.mark.skipif(not LocalPath('/proc/self/status').exists(), reason='requires procfs')
+def test_copy_to_from_file_reporting_zero_size(tmp_path: pathlib.Path):
+    source = LocalPath('/proc/self/status')
+    assert source.stat().st_size == 0
+    target = LocalPath(tmp_path, 'target')
+    n = source.copy_to(target)
+    assert target.read_bytes().startswith(b'Name:')
+    assert n == len(target.read_bytes())
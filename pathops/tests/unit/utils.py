@@ -16,9 +16,32 @@
 
 from __future__ import annotations
 
+import datetime
+import pathlib
+
 from ops import pebble
 
 
+def make_fileinfo(
+    path: str,
+    filetype: pebble.FileType = pebble.FileType.FILE,
+    size: int = 0,
+    permissions: int = 0o644,
+) -> pebble.FileInfo:
+    return pebble.FileInfo(
+        path=path,
+        name=pathlib.PurePath(path).name,
+        type=filetype,
+        size=size,
+        permissions=permissions,
+        last_modified=datetime.datetime.now(),
+        user_id=0,
+        user='root',
+        group_id=0,
+        group='root',
+    )
+
+
 def raise_unknown_api_error(*args: object, **kwargs: object):
     raise pebble.APIError(body={}, code=9000, status='', message='')
 
@@ -31,6 +54,10 @@ def raise_permission_denied(*args: object, **kwargs: object):
     raise pebble.PathError(kind='permission-denied', message='')
 
 
+def raise_not_found_path_error(*args: object, **kwargs: object):
+    raise pebble.PathError(kind='not-found', message='')
+
+
 def raise_unknown_path_error(*args: object, **kwargs: object):
     raise pebble.PathError(kind='unknown-kind', message='unknown-message')
 